@@ -7,6 +7,7 @@ import argparse
 import datetime
 
 from src.hybrid_search.init_db import initialise_database
+from src.hybrid_search.models_cache import warm_up
 from src import pipeline
 
 
@@ -50,6 +51,9 @@ def main() -> None:
 
     # Run search queries based on specified method
     if args.search:
+        # Warm up the models before prompting so the first query is fast
+        warm_up(args.search)
+
         # Get query and top_n from user input
         query = input("Enter your search query: ").strip()
 
@@ -5,11 +5,14 @@
 # using SentenceTransformer.
 
 import datetime
-from sentence_transformers import SentenceTransformer
+from itertools import islice
 
+from src.hybrid_search.models_cache import get_embed_model
 from src.hybrid_search.setup_db import SessionLocal
 from src.hybrid_search.models import Pokemon
 
+BATCH_SIZE = 64
+
 
 def generate_embeddings(verbose: bool = True) -> None:
     """
@@ -17,33 +20,59 @@ def generate_embeddings(verbose: bool = True) -> None:
 
     Encodes each Pokemon's name, type, and info into a vector embedding
     using the SentenceTransformer model and saves it to the database.
-    
+    Rows are streamed and processed in windowed batches, so memory stays
+    O(batch) regardless of catalog size.
+
     Args:
         verbose: If True, print progress messages.
     """
-    session = SessionLocal()
-    model = SentenceTransformer("all-MiniLM-L6-v2")
-    pokemons: list[Pokemon] = session.query(Pokemon).filter(
-        Pokemon.embedding == None
-        ).all()  # noqa: E711
-    
-    if verbose:
-        if not pokemons:
-            print(f"[{datetime.datetime.now()}] No new Pokémon to generate embeddings for.")
-            session.close()
-            return
+    model = get_embed_model()
 
-        print(f"[{datetime.datetime.now()}] Generating embeddings for {len(pokemons)} Pokémon...")
+    # Separate read and write sessions: the read side streams rows with a
+    # server-side cursor, which a commit on the same session would close
+    with SessionLocal() as read_session, SessionLocal() as write_session:
+        # Only pull the id and text columns; the stats columns and any
+        # existing embedding vectors are never read here
+        rows = iter(
+            read_session.query(
+                Pokemon.id, Pokemon.name, Pokemon.type, Pokemon.info
+                ).filter(
+                Pokemon.embedding == None
+                ).yield_per(BATCH_SIZE)  # noqa: E711
+        )
 
-    for i, pokemon in enumerate(pokemons):
-        text: str = f"{pokemon.name}. Type: {pokemon.type}. {pokemon.info}"
-        pokemon.embedding = model.encode(text).tolist()
-        
-        if verbose and (i + 1) % 100 == 0:
-            print(f"Processed {i + 1}/{len(pokemons)} Pokemon")
+        total = 0
+        while batch := list(islice(rows, BATCH_SIZE)):
+            # Encode the whole batch in one call instead of one forward
+            # pass per Pokémon, amortizing the per-call model overhead
+            texts: list[str] = [
+                f"{pokemon.name}. Type: {pokemon.type}. {pokemon.info}"
+                for pokemon in batch
+            ]
+            # L2-normalise at ingest so similarity search can use the
+            # cheaper inner-product metric instead of cosine distance
+            embeddings = model.encode(
+                texts,
+                batch_size=BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+
+            # Write the batch back in one batched UPDATE instead of relying
+            # on ORM dirty-tracking to flush each row individually
+            write_session.bulk_update_mappings(Pokemon, [
+                {"id": pokemon.id, "embedding": embedding.tolist()}
+                for pokemon, embedding in zip(batch, embeddings)
+            ])
+            write_session.commit()
+
+            total += len(batch)
+            if verbose:
+                print(f"[{datetime.datetime.now()}] Processed {total} Pokémon...")
 
-    session.commit()
-    session.close()
-    
     if verbose:
-        print(f"[{datetime.datetime.now()}] Embeddings generation complete!")
+        if total == 0:
+            print(f"[{datetime.datetime.now()}] No new Pokémon to generate embeddings for.")
+        else:
+            print(f"[{datetime.datetime.now()}] Embeddings generation complete!")
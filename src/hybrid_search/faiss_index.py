@@ -0,0 +1,89 @@
+# faiss_index.py
+#
+# Description:
+# Build, persist, and query an in-process FAISS index over the Pokémon
+# embeddings, avoiding the per-query transfer of the full embedding
+# column out of Postgres.
+
+import datetime
+import os
+from typing import List
+
+import faiss
+import numpy as np
+
+from src.hybrid_search.setup_db import SessionLocal
+from src.hybrid_search.models import Pokemon
+
+INDEX_PATH = "pokedex.faiss"
+EMBEDDING_DIM = 384
+
+_index: faiss.Index | None = None
+
+
+def build_faiss_index(verbose: bool = False) -> None:
+    """
+    Build a FAISS index from all stored embeddings and persist it to disk.
+
+    Uses an exact inner-product index over L2-normalised vectors, which is
+    equivalent to cosine similarity.
+
+    Args:
+        verbose: If True, print progress information.
+    """
+    global _index
+
+    with SessionLocal() as session:
+        rows = session.query(Pokemon.id, Pokemon.embedding).filter(
+            Pokemon.embedding != None
+            ).all()  # noqa: E711
+
+    if not rows:
+        if verbose:
+            print(f"[{datetime.datetime.now()}] No embeddings available to build FAISS index.")
+        return
+
+    ids = np.array([row.id for row in rows], dtype="int64")
+    vectors = np.vstack([row.embedding for row in rows]).astype("float32")
+
+    # Cosine similarity via inner product on L2-normalised vectors
+    faiss.normalize_L2(vectors)
+    index = faiss.IndexIDMap(faiss.IndexFlatIP(EMBEDDING_DIM))
+    index.add_with_ids(vectors, ids)
+
+    faiss.write_index(index, INDEX_PATH)
+    _index = index
+
+    if verbose:
+        print(f"[{datetime.datetime.now()}] Built FAISS index with {index.ntotal} vectors at {INDEX_PATH}")
+
+
+def get_faiss_index() -> faiss.Index | None:
+    """
+    Return the FAISS index, loading it from disk on first use.
+
+    Returns:
+        The loaded index, or None if no index has been built yet.
+    """
+    global _index
+    if _index is None and os.path.exists(INDEX_PATH):
+        _index = faiss.read_index(INDEX_PATH)
+    return _index
+
+
+def search_index(index: faiss.Index, query_embedding, limit: int) -> List[int]:
+    """
+    Return the ids of the top matching Pokémon for a query embedding.
+
+    Args:
+        index: FAISS index to search.
+        query_embedding: Query vector (list or numpy array).
+        limit: Maximum number of ids to return.
+
+    Returns:
+        List of Pokémon ids ordered by similarity.
+    """
+    query = np.asarray(query_embedding, dtype="float32").reshape(1, -1)
+    faiss.normalize_L2(query)
+    _, ids = index.search(query, limit)
+    return [int(i) for i in ids[0] if i != -1]
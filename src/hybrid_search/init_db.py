@@ -8,6 +8,7 @@ import datetime
 from src.hybrid_search.setup_db import Base, engine
 from src.hybrid_search.load_data import load_csv
 from src.hybrid_search.embeddings import generate_embeddings
+from src.hybrid_search.faiss_index import build_faiss_index
 
 DATASET_CSV_PATH = "pokemon-dataset/pokedex.csv"
 
@@ -26,3 +27,4 @@ def initialise_database(verbose: bool = False):
     Base.metadata.create_all(bind=engine)
     load_csv(DATASET_CSV_PATH, verbose=verbose)
     generate_embeddings(verbose=verbose)
+    build_faiss_index(verbose=verbose)
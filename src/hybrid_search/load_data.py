@@ -4,8 +4,8 @@
 # Loads data of pokemon into the database from a CSV file. Also see:
 # https://www.kaggle.com/datasets/rzgiza/pokdex-for-all-1025-pokemon-w-text-description?
 
+import csv
 import datetime
-import pandas as pd
 
 from src.hybrid_search.setup_db import SessionLocal
 from src.hybrid_search.models import Pokemon
@@ -19,43 +19,53 @@ def load_csv(path: str, verbose: bool = False) -> None:
         path: Path to the CSV file containing Pokémon data.
         verbose: If True, print progress information.
     """
-    df = pd.read_csv(path)
-    session = SessionLocal()
+    # Stream the CSV with the stdlib reader; a full DataFrame is overkill
+    # for a one-shot ingest of this size
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        rows = list(csv.DictReader(csv_file))
 
     if verbose:
-        print(f"[{datetime.datetime.now()}] Loading {len(df)} Pokémon from {path}...")
+        print(f"[{datetime.datetime.now()}] Loading {len(rows)} Pokémon from {path}...")
 
-    new_pokemon = 0
+    with SessionLocal() as session:
+        # Fetch all existing ids in one query instead of one round-trip per row
+        existing_ids = {
+            row_id for (row_id,) in session.query(Pokemon.id).all()
+        }
+
+        # Collect new rows as dicts and insert them in one bulk statement,
+        # bypassing the per-object ORM unit-of-work overhead
+        new_rows: list[dict] = []
+
+        for idx, row in enumerate(rows, 1):
+            # Check if Pokémon already exists
+            if int(row["id"]) in existing_ids:
+                continue
 
-    for idx, (_, row) in enumerate(df.iterrows(), 1):
-        # Check if Pokémon already exists
-        existing = session.query(Pokemon).filter(Pokemon.id == int(row["id"])).first()
-        if existing:
-            continue
-        else:
-            new_pokemon += 1
             if verbose:
-                print(f"  [{datetime.datetime.now()}] [{idx}/{len(df)}] Adding {row['name']}...")
-            
-        pokemon = Pokemon(
-            id=int(row["id"]),
-            name=row["name"],
-            height=int(row["height"]),
-            weight=int(row["weight"]),
-            hp=int(row["hp"]),
-            attack=int(row["attack"]),
-            defense=int(row["defense"]),
-            s_attack=int(row["s_attack"]),
-            s_defense=int(row["s_defense"]),
-            speed=int(row["speed"]),
-            type=row["type"].strip("{}"),
-            evo_set=int(row["evo_set"]),
-            info=row["info"],
-        )
-        session.add(pokemon)
+                print(f"  [{datetime.datetime.now()}] [{idx}/{len(rows)}] Adding {row['name']}...")
+
+            new_rows.append({
+                "id": int(row["id"]),
+                "name": row["name"],
+                "height": int(row["height"]),
+                "weight": int(row["weight"]),
+                "hp": int(row["hp"]),
+                "attack": int(row["attack"]),
+                "defense": int(row["defense"]),
+                "s_attack": int(row["s_attack"]),
+                "s_defense": int(row["s_defense"]),
+                "speed": int(row["speed"]),
+                "type": row["type"].strip("{}"),
+                "evo_set": int(row["evo_set"]),
+                "info": row["info"],
+            })
+
+        new_pokemon = len(new_rows)
 
-    session.commit()
-    session.close()
+        if new_rows:
+            session.bulk_insert_mappings(Pokemon, new_rows)
+        session.commit()
 
     if verbose:
         if new_pokemon == 0:
@@ -0,0 +1,120 @@
+# models_cache.py
+#
+# Description:
+# Module-level singletons for the SentenceTransformer embedding model and
+# the CrossEncoder rerank model, so each model is loaded from disk once
+# and reused across embedding generation and search queries.
+
+import os
+
+import torch
+from sentence_transformers import CrossEncoder, SentenceTransformer
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+RERANK_MODEL_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+# Use all physical cores for the transformer forward pass; the torch
+# default often leaves cores idle. Override with TORCH_NUM_THREADS.
+torch.set_num_threads(int(os.getenv("TORCH_NUM_THREADS", os.cpu_count() // 2 or 1)))
+torch.set_num_interop_threads(1)
+
+# Optional device override for both models (e.g. "cuda", "mps"); by
+# default sentence-transformers picks the best available device
+MODEL_DEVICE: str | None = os.getenv("MODEL_DEVICE")
+
+# Optional local directory for model weights, so cold starts in
+# containers can reuse a mounted cache instead of re-downloading
+MODEL_CACHE_DIR: str | None = os.getenv("MODEL_CACHE_DIR")
+
+# Set MODEL_BACKEND=onnx to run both models on ONNX Runtime instead of
+# PyTorch (requires the sentence-transformers[onnx] extra); ONNX uses
+# fused kernels and is typically faster on CPU
+MODEL_BACKEND: str = os.getenv("MODEL_BACKEND", "torch")
+
+# Set QUANTIZE_INT8=1 to quantize the Linear layers of both models to
+# int8 for faster CPU inference at a small accuracy cost
+# (torch backend only)
+QUANTIZE_INT8: bool = os.getenv("QUANTIZE_INT8", "0") == "1"
+
+# Set USE_TORCH_COMPILE=1 to compile the transformer forward pass with
+# Inductor; the first encode pays the compilation cost (torch backend only)
+USE_TORCH_COMPILE: bool = os.getenv("USE_TORCH_COMPILE", "0") == "1"
+
+_embed_model: SentenceTransformer | None = None
+_rerank_model: CrossEncoder | None = None
+
+
+def _quantize_int8(module: torch.nn.Module) -> torch.nn.Module:
+    """
+    Apply dynamic int8 quantization to the Linear layers of a module.
+    """
+    return torch.quantization.quantize_dynamic(
+        module, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def _compile(module: torch.nn.Module) -> torch.nn.Module:
+    """
+    Compile a module with torch.compile, falling back to the original
+    module on platforms where Inductor is unavailable.
+    """
+    try:
+        return torch.compile(module, mode="reduce-overhead", dynamic=True)
+    except Exception:
+        return module
+
+
+def get_embed_model() -> SentenceTransformer:
+    """
+    Return the shared SentenceTransformer embedding model,
+    loading it on first use.
+    """
+    global _embed_model
+    if _embed_model is None:
+        _embed_model = SentenceTransformer(
+            EMBEDDING_MODEL_NAME,
+            backend=MODEL_BACKEND,
+            device=MODEL_DEVICE,
+            cache_folder=MODEL_CACHE_DIR,
+        )
+        if QUANTIZE_INT8 and MODEL_BACKEND == "torch":
+            _embed_model[0].auto_model = _quantize_int8(_embed_model[0].auto_model)
+        if USE_TORCH_COMPILE and MODEL_BACKEND == "torch":
+            _embed_model[0].auto_model = _compile(_embed_model[0].auto_model)
+    return _embed_model
+
+
+def get_rerank_model() -> CrossEncoder:
+    """
+    Return the shared CrossEncoder rerank model,
+    loading it on first use.
+    """
+    global _rerank_model
+    if _rerank_model is None:
+        _rerank_model = CrossEncoder(
+            RERANK_MODEL_NAME,
+            backend=MODEL_BACKEND,
+            device=MODEL_DEVICE,
+            cache_folder=MODEL_CACHE_DIR,
+            max_length=256,
+        )
+        if QUANTIZE_INT8 and MODEL_BACKEND == "torch":
+            _rerank_model.model = _quantize_int8(_rerank_model.model)
+        if USE_TORCH_COMPILE and MODEL_BACKEND == "torch":
+            _rerank_model.model = _compile(_rerank_model.model)
+    return _rerank_model
+
+
+def warm_up(search_method: str = "hybrid") -> None:
+    """
+    Load and exercise the models a search method needs, so the first real
+    query doesn't pay the model load and first-inference cost.
+
+    Args:
+        search_method: Search method that will be used ('keyword',
+            'semantic', or 'hybrid').
+    """
+    if search_method in ("semantic", "hybrid"):
+        get_embed_model().encode("warmup")
+    if search_method == "hybrid":
+        get_rerank_model().predict([("warmup", "warmup")])
@@ -5,16 +5,48 @@
 # for querying Pokémon embeddings and metadata from the database.
 
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import datetime
 import itertools
+import os
 import textwrap
 
-from sqlalchemy import func
-from sentence_transformers import CrossEncoder, SentenceTransformer
+import numpy as np
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import bindparam, func, select, text
+from sqlalchemy.orm import defer
 
+from src.hybrid_search.faiss_index import get_faiss_index, search_index
+from src.hybrid_search.models_cache import get_embed_model, get_rerank_model
 from src.hybrid_search.setup_db import SessionLocal
 from src.hybrid_search.models import Pokemon
 
+# Recall/latency knob for the pgvector HNSW index scan
+HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", "100"))
+
+# Built once with bound parameters so the compiled SQL is reused across
+# queries instead of embedding each query vector into a fresh statement
+_SEMANTIC_STMT = (
+    select(Pokemon)
+    .options(defer(Pokemon.embedding), defer(Pokemon.info_tsv))
+    .order_by(
+        Pokemon.embedding.max_inner_product(bindparam("q", type_=HALFVEC(384)))
+    )
+    .limit(bindparam("k"))
+)
+
+
+@lru_cache(maxsize=128)
+def _encode_query(query: str) -> tuple:
+    """
+    Encode a query string, caching the result so repeated queries skip
+    the transformer forward pass. Returns a tuple so the value is
+    hashable and immutable.
+    """
+    return tuple(
+        get_embed_model().encode(query, normalize_embeddings=True).tolist()
+    )
 
 def keyword_search(query: str, limit: int = 5, verbose: bool = False) -> List[Pokemon]:
     """
@@ -28,24 +60,22 @@ def keyword_search(query: str, limit: int = 5, verbose: bool = False) -> List[Po
     Returns:
         List of Pokemon objects ordered by text relevance.
     """
-    session = SessionLocal()
-
     ts_query = func.plainto_tsquery("english", query)
-    ts_vector = func.to_tsvector("english", Pokemon.info)
-    rank = func.ts_rank_cd(ts_vector, ts_query)
-
-    results = (
-        session.query(Pokemon)
-        .filter(ts_vector.op("@@")(ts_query))
-        .order_by(rank.desc())
-        .limit(limit)
-        .all()
-    )
+    rank = func.ts_rank_cd(Pokemon.info_tsv, ts_query)
+
+    with SessionLocal() as session:
+        results = (
+            session.query(Pokemon)
+            .options(defer(Pokemon.embedding), defer(Pokemon.info_tsv))
+            .filter(Pokemon.info_tsv.op("@@")(ts_query))
+            .order_by(rank.desc())
+            .limit(limit)
+            .all()
+        )
 
     if verbose:
         print(f"[{datetime.datetime.now()}] Keyword search found {len(results)} results")
 
-    session.close()
     return results
 
 def semantic_search(query: str, limit: int = 5, verbose: bool = False) -> List[Pokemon]:
@@ -60,22 +90,34 @@ def semantic_search(query: str, limit: int = 5, verbose: bool = False) -> List[P
     Returns:
         List of Pokemon objects ordered by embedding similarity.
     """
-    session = SessionLocal()
-    embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-
-    query_embedding = embedding_model.encode(query).tolist()
-
-    results = (
-        session.query(Pokemon)
-        .order_by(Pokemon.embedding.cosine_distance(query_embedding))
-        .limit(limit)
-        .all()
-    )
+    query_embedding = np.asarray(_encode_query(query), dtype="float32")
+
+    with SessionLocal() as session:
+        index = get_faiss_index()
+        if index is not None:
+            # Search the in-process FAISS index and fetch only the matching
+            # rows by primary key, preserving the FAISS ranking
+            ids = search_index(index, query_embedding, limit)
+            pokemons = (
+                session.query(Pokemon)
+                .options(defer(Pokemon.embedding), defer(Pokemon.info_tsv))
+                .filter(Pokemon.id.in_(ids))
+                .all()
+            )
+            by_id = {pokemon.id: pokemon for pokemon in pokemons}
+            results = [by_id[i] for i in ids if i in by_id]
+        else:
+            # No index built yet; fall back to a pgvector similarity scan.
+            # Widen the HNSW search beam for this transaction only.
+            session.execute(text(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH}"))
+            results = session.execute(
+                _SEMANTIC_STMT,
+                {"q": query_embedding.tolist(), "k": limit},
+            ).scalars().all()
 
     if verbose:
         print(f"[{datetime.datetime.now()}] Semantic search found {len(results)} results")
 
-    session.close()
     return results
 
 def rerank(query: str, result_sets: List[List[Pokemon]], verbose: bool = False) -> List[Pokemon]:
@@ -91,22 +133,31 @@ def rerank(query: str, result_sets: List[List[Pokemon]], verbose: bool = False)
         Reranked list of unique Pokemon objects.
     """
     combined_results = itertools.chain.from_iterable(result_sets)
-    unique_results = {pokemon.id: pokemon for pokemon in combined_results}.values()
+    unique_results = list({pokemon.id: pokemon for pokemon in combined_results}.values())
 
     if verbose:
         print(f"[{datetime.datetime.now()}] Reranking {len(unique_results)} results")
 
-    rerank_model = CrossEncoder("cross-encoder/ms-marco-MiniLM-L-6-v2")
-    scores = rerank_model.predict(
-        [(query, pokemon.info) for pokemon in unique_results]
+    rerank_model = get_rerank_model()
+
+    # Score pairs sorted by info length so short descriptions aren't padded
+    # to the longest one in the batch, then scatter the scores back into
+    # the original order
+    length_order = sorted(
+        range(len(unique_results)), key=lambda i: len(unique_results[i].info)
+    )
+    scores_sorted = rerank_model.predict(
+        [(query, unique_results[i].info) for i in length_order],
+        batch_size=32,
+        convert_to_numpy=True,
     )
+    scores = np.empty(len(unique_results), dtype=np.float32)
+    scores[length_order] = scores_sorted
 
-    reranked = [
-        pokemon
-        for _, pokemon in sorted(
-            zip(scores, unique_results), reverse=True
-        )
-    ]
+    # Sort by score with argsort rather than sorted(zip(...)), which would
+    # fall back to comparing Pokemon objects on tied scores
+    order = np.argsort(-scores)
+    reranked = [unique_results[i] for i in order]
 
     return reranked
 
@@ -125,10 +176,24 @@ def hybrid_search(query: str, limit: int = 5, verbose: bool = False) -> List[Pok
     if verbose:
         print(f"[{datetime.datetime.now()}] Performing hybrid search")
 
-    keyword_results = keyword_search(query, limit, verbose)
-    semantic_results = semantic_search(query, limit, verbose)
-
-    reranked_results = rerank(query, [keyword_results, semantic_results], verbose)
+    # Keyword and semantic retrieval are independent; run them in parallel
+    # so the slower one hides behind the other. Each opens its own session.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        keyword_future = executor.submit(keyword_search, query, limit, verbose)
+        semantic_future = executor.submit(semantic_search, query, limit, verbose)
+        keyword_results = keyword_future.result()
+        semantic_results = semantic_future.result()
+
+    # The cross-encoder dominates hybrid cost; skip it when the deduped
+    # candidates already fit within the requested limit
+    candidates = list({
+        pokemon.id: pokemon
+        for pokemon in itertools.chain(keyword_results, semantic_results)
+    }.values())
+    if len(candidates) <= limit:
+        return candidates
+
+    reranked_results = rerank(query, [candidates], verbose)
     return reranked_results[:limit]
 
 def search_pokemon(
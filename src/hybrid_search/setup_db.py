@@ -16,9 +16,9 @@ load_dotenv()
 DATABASE_URL: str | None = os.getenv("DATABASE_URL")
 engine: Engine | None = None
 try:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(DATABASE_URL, pool_size=5, pool_pre_ping=True)
 except Exception as e:
     print("Unable to access postgresql database", repr(e))
 
-SessionLocal: sessionmaker[Session] = sessionmaker(bind=engine)
+SessionLocal: sessionmaker[Session] = sessionmaker(bind=engine, expire_on_commit=False)
 Base = declarative_base()
\ No newline at end of file
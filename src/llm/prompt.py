@@ -4,6 +4,7 @@
 # Prompt builder for Pokémon RAG queries.
 
 import datetime
+from functools import lru_cache
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,21 +22,23 @@ def process_pokemon(pokemon: "Pokemon", position: int) -> str:
     Returns:
         str: A formatted string representation of the Pokémon.
     """
-    return (
-        f"{position}. {pokemon.name}\n"
-        f"  id: {pokemon.id}\n"
-        f"  height: {pokemon.height}\n"
-        f"  weight: {pokemon.weight}\n"
-        f"  hp: {pokemon.hp}\n"
-        f"  attack: {pokemon.attack}\n"
-        f"  defense: {pokemon.defense}\n"
-        f"  s_attack: {pokemon.s_attack}\n"
-        f"  s_defense: {pokemon.s_defense}\n"
-        f"  speed: {pokemon.speed}\n"
-        f"  type: {pokemon.type}\n"
-        f"  evo_set: {pokemon.evo_set}\n"
-        f"  info: {pokemon.info}"
-    )
+    # Assemble per-field lines and join once, avoiding intermediate
+    # concatenations on this per-result hot path
+    return "\n".join([
+        f"{position}. {pokemon.name}",
+        f"  id: {pokemon.id}",
+        f"  height: {pokemon.height}",
+        f"  weight: {pokemon.weight}",
+        f"  hp: {pokemon.hp}",
+        f"  attack: {pokemon.attack}",
+        f"  defense: {pokemon.defense}",
+        f"  s_attack: {pokemon.s_attack}",
+        f"  s_defense: {pokemon.s_defense}",
+        f"  speed: {pokemon.speed}",
+        f"  type: {pokemon.type}",
+        f"  evo_set: {pokemon.evo_set}",
+        f"  info: {pokemon.info}",
+    ])
 
 def build_pokemon_context(documents: List["Pokemon"]) -> str:
     """
@@ -51,10 +54,13 @@ def build_pokemon_context(documents: List["Pokemon"]) -> str:
         process_pokemon(doc, i + 1) for i, doc in enumerate(documents)
     )
 
+@lru_cache(maxsize=1)
 def system_prompt() -> str:
     """
     Returns the system prompt for the LLM instructing it on handling Pokémon RAG queries.
 
+    The prompt is fixed, so the assembled string is cached after the first call.
+
     Returns:
         str: The system prompt string.
     """
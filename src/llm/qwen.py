@@ -13,11 +13,83 @@ from src.llm.prompt import system_prompt
 
 load_dotenv()
 
+# Shared async client so concurrent callers reuse one connection pool
+# instead of opening (and leaking) a new one per request
+_async_client = ollama.AsyncClient()
+
+
+def generate_answer_stream(prompt: str, verbose: bool = False):
+    """
+    Stream an answer from the LLM, yielding content chunks as they are
+    generated instead of buffering the full response.
+
+    Raises on generation errors; generate_answer wraps this with the
+    error handling used by the pipeline.
+
+    Args:
+        prompt (str): The complete prompt to send to the src.llm.
+        verbose (bool): If True, prints debug information.
+
+    Yields:
+        str: The next chunk of the generated answer.
+    """
+    model = os.getenv("QWEN_MODEL", "qwen2.5:3b-instruct")
+
+    if verbose:
+        print(f"[{datetime.datetime.now()}] Generating answer using model '{model}'")
+
+    for chunk in ollama.chat(
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": system_prompt(),
+            },
+            {
+                "role": "user",
+                "content": prompt,
+            },
+        ],
+        options={"temperature": 0.0},
+        stream=True,
+    ):
+        yield chunk.get("message", {}).get("content", "")
 
 def generate_answer(prompt: str, verbose: bool = False) -> str:
     """
     Generate an answer with the LLM based on the provided prompt.
 
+    Joins the streamed chunks into the full answer; use
+    generate_answer_stream directly for incremental output.
+
+    Args:
+        prompt (str): The complete prompt to send to the src.llm.
+        verbose (bool): If True, prints debug information.
+
+    Returns:
+        str: The generated answer from the LLM, or an error message if generation fails.
+    """
+    try:
+        answer = "".join(generate_answer_stream(prompt, verbose=verbose))
+        if not answer:
+            raise ValueError("Received empty response from the src.llm.")
+        else:
+            if verbose:
+                print(f"[{datetime.datetime.now()}] Successfully generated answer from LLM!\n")
+
+        return answer
+    except Exception as e:
+        error_msg = f"Error generating answer with Qwen model: {e}"
+        if verbose:
+            print(f"[{datetime.datetime.now()}] {error_msg}")
+        return error_msg
+
+async def generate_answer_async(prompt: str, verbose: bool = False) -> str:
+    """
+    Async variant of generate_answer, so multiple queries can be in
+    flight at once and benefit from Ollama's server-side batching
+    (see the OLLAMA_NUM_PARALLEL env var of the Ollama server).
+
     Args:
         prompt (str): The complete prompt to send to the src.llm.
         verbose (bool): If True, prints debug information.
@@ -31,7 +103,7 @@ def generate_answer(prompt: str, verbose: bool = False) -> str:
         if verbose:
             print(f"[{datetime.datetime.now()}] Generating answer using model '{model}'")
 
-        response = ollama.chat(
+        response = await _async_client.chat(
             model=model,
             messages=[
                 {
@@ -8,7 +8,7 @@ import datetime
 
 from src.hybrid_search.search import search_pokemon
 from src.llm.prompt import pokedex_prompt
-from src.llm.qwen import generate_answer
+from src.llm.qwen import generate_answer, generate_answer_async
 
 
 def pipeline(
@@ -38,4 +38,34 @@ def pipeline(
     prompt = pokedex_prompt(query, documents, limit=top_n, verbose=verbose)
     answer = generate_answer(prompt, verbose=verbose)
 
-    return answer
\ No newline at end of file
+    return answer
+
+async def pipeline_async(
+    query: str = "flower Pokémon",
+    top_n: int = 5,
+    search_method: str = 'hybrid',
+    verbose: bool = False
+) -> str:
+    """
+    Async variant of the RAG pipeline. Retrieval runs as usual, but
+    answer generation awaits the Ollama async client, so batch callers
+    can run several queries concurrently with asyncio.gather and let the
+    Ollama server batch them (see its OLLAMA_NUM_PARALLEL env var).
+
+    Args:
+        query: Search query string.
+        top_n: Number of top results to retrieve.
+        search_method: Search method to use ('keyword', 'semantic', 'hybrid').
+        verbose: Enable verbose output.
+
+    Returns:
+        The generated answer, or an error message if generation fails.
+    """
+    if verbose:
+        print(f"[{datetime.datetime.now()}] Searching for '{query}' (top {top_n}) using {search_method} method...")
+
+    documents = search_pokemon(query, limit=top_n, search_method=search_method, verbose=verbose)
+    prompt = pokedex_prompt(query, documents, limit=top_n, verbose=verbose)
+    answer = await generate_answer_async(prompt, verbose=verbose)
+
+    return answer